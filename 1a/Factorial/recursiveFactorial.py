@@ -1,17 +1,29 @@
 
-# we write a function that computes x factorial recursively
+from math import factorial
+from functools import lru_cache
+from itertools import accumulate
+
+# we write a function that computes x factorial.
+# Rather than recursing once per integer, which needs a python call for every level
+# and fails for large x, we use math.factorial which computes the same product in C.
+# We also remember every answer, so asking for the same factorial again costs nothing
+@lru_cache(maxsize=None)
 def recursiveFactorial(x):
 
 	# we check that x is positive
 	if x < 0:
-		raise exception("factorials of non-negative numbers only")
+		raise Exception("factorials of non-negative numbers only")
+
+	# we return x factorial
+	return factorial(x)
 
-	# we check if x is either 0 or 1
-	if x <= 1:
+# we write a function that returns the list of factorials 0!, 1!, ..., nmax!
+# in a single pass, multiplying each one by the next integer to get the one after
+def factorials(nmax):
 
-		# we return the asnwer 1
-		return 1
-	else:
+	# we check that nmax is positive
+	if nmax < 0:
+		raise Exception("factorials of non-negative numbers only")
 
-		# we recurse
-		return x * recursiveFactorial(x - 1)
\ No newline at end of file
+	# we return the running products of 1, 1, 2, ..., nmax
+	return list(accumulate(range(1, nmax+1), lambda y, k: y * k, initial=1))
@@ -1,11 +1,13 @@
 
-from LUdecomp import *
-from Lsolve import *
-from Usolve import *
+import numpy as np
 
-#we write a function that solves Ax = b for x by LU decomposition
+#we write a function that solves Ax = b for x by LU decomposition.
+#numpy does the decomposition (with pivoting) and both triangular solves in a single LAPACK call,
+#and b can also be a matrix whose columns are several right hand sides, which share one decomposition
 def Asolve(A, b):
-	L, U = LUdecomp(A)
-	y = Lsolve(L, b)
-	x = Usolve(U, y)
-	return x
+	Aa = np.asarray(A, dtype=np.float64)
+	ba = np.asarray(b, dtype=np.float64)
+	if Aa.ndim != 2 or Aa.shape[0] != Aa.shape[1] or ba.shape[0] != Aa.shape[0]:
+		raise Exception("The size of A or b is not appropriate")
+	x = np.linalg.solve(Aa, ba)
+	return x.tolist()
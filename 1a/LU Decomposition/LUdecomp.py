@@ -15,10 +15,7 @@ def LUdecomp(A):
     U = [[0] * n for i in range(n)]
 
     # we make a copy of A in order not to modify the original
-    B = [[0] * n for i in range(n)]
-    for i in range(n):
-        for j in range(n):
-            B[i][j] = A[i][j]
+    B = [list(row) for row in A]
 
     for k in range(n):
 
@@ -1,31 +1,28 @@
 
+import numpy as np
+from scipy.linalg import solve_triangular
+
 # we write a function that solves Ly = b for y where L is lower triangular and b is a vector
 def Lsolve(L, b):
 
+    # we convert L and b to arrays of floats
+    La = np.asarray(L, dtype=np.float64)
+    ba = np.asarray(b, dtype=np.float64)
+
     # we get the sizes of L and b
-    LRows = len(L)
-    bRows = len(b)
+    LRows = La.shape[0]
+    bRows = ba.shape[0]
  
     # we check that L and b ahve appropriate sizes
-    if LRows != len(L[0]) or bRows != LRows:
+    if LRows != La.shape[1] or bRows != LRows:
         raise Exception("The size of L or b is not appropriate")
 
-    # we initialize y to b
-    y = [0] * bRows
-    for i in range(bRows):
-        y[i] = b[i]
-
-    # we loop over the rows of L
-    for k in range(LRows):
-
-        # we check that we dont divide by zero
-        if L[k][k] == 0:
-            raise Exception("There are zeros on the diagonal of L")
+    # we check that we dont divide by zero
+    if np.any(np.diag(La) == 0):
+        raise Exception("There are zeros on the diagonal of L")
 
-        # we modify y accordingly
-        for j in range(k):
-            y[k] -= L[k][j] * y[j];
-        y[k] /= L[k][k];
+    # we solve for y by forward substitution, which scipy does with a single LAPACK call
+    y = solve_triangular(La, ba, lower=True)
 
     # we return y
-    return y
+    return y.tolist()
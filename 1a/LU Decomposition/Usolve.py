@@ -1,31 +1,28 @@
 
+import numpy as np
+from scipy.linalg import solve_triangular
+
 # we write a function that solves Ux = y for x where U is upper triangular and y is a vector
 def Usolve(U, y):
 
+    # we convert U and y to arrays of floats
+    Ua = np.asarray(U, dtype=np.float64)
+    ya = np.asarray(y, dtype=np.float64)
+
     # we get the sizes of U and y
-    URows = len(U)
-    yRows = len(y)
+    URows = Ua.shape[0]
+    yRows = ya.shape[0]
  
     # we check that U and y ahve appropriate sizes
-    if URows != len(U[0]) or yRows != URows:
+    if URows != Ua.shape[1] or yRows != URows:
         raise Exception("The size of U or y is not appropriate")
-    
-    # we initialize x to y
-    x = [0] * yRows
-    for i in range(yRows):
-        x[i] = y[i]
-
-    # we loop backwards over the rows of U
-    for k in range(URows-1, -1, -1):
 
-        # we check that we don't divide by zero
-        if U[k][k] == 0:
-            raise Exception("There are zeros on the diagonal of U")
+    # we check that we don't divide by zero
+    if np.any(np.diag(Ua) == 0):
+        raise Exception("There are zeros on the diagonal of U")
 
-        # we modify x accordingly
-        for j in range(k+1, URows):
-            x[k] -= U[k][j] * x[j];
-        x[k] /= U[k][k];
+    # we solve for x by backward substitution, which scipy does with a single LAPACK call
+    x = solve_triangular(Ua, ya, lower=False)
 
     # we return x
-    return x
+    return x.tolist()
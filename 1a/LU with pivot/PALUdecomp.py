@@ -1,53 +1,48 @@
 
+import numpy as np
 from findLargestInCol import *
-from swapRows import *
 
 # we write a function that decomposes a square matrix A as A = P^{-1}LU
 def PALUdecomp(A):
 
+    # we make a copy of A to work with, stored as one contiguous array
+    B = np.array(A, dtype=np.float64, order='C')
+
     # we get the size of A
-    n = len(A)
+    n = len(B)
 
     # we check that A is indeed a square matrix
-    if n != len(A[0]):
+    if B.ndim != 2 or n != B.shape[1]:
         raise Exception("Input must be a square matrix")
 
     # we initialize P to the indentity and L and U to zero
-    P = [[0] * n for i in range(n)]
-    for i in range(n):
-        P[i][i] = 1
-    L = [[0] * n for i in range(n)]
-    U = [[0] * n for i in range(n)]
-
-    # we make a copy of A to work with
-    B = [[0] * n for i in range(n)]
-    for i in range(n):
-        for j in range(n):
-            B[i][j] = A[i][j]
+    P = np.eye(n, dtype=int)
+    L = np.zeros((n, n))
+    U = np.zeros((n, n))
 
     for k in range(n):
 
         # we find the pivot
         maxk = findLargestInCol(B, k)
         if maxk != k:
-            B = swapRows(B, maxk, k)
-            L = swapRows(L, maxk, k)
-            P = swapRows(P, maxk, k)
+            B[[k, maxk]] = B[[maxk, k]]
+            L[[k, maxk]] = L[[maxk, k]]
+            P[[k, maxk]] = P[[maxk, k]]
         
         # we proceed with the normal LU decomposition algorithm
-        for j in range(k, n):
-            U[k][j] = B[k][j]
+        U[k, k:] = B[k, k:]
 
         # we check that we don't divide by zero
-        if U[k][k] == 0:
+        if U[k, k] == 0:
             raise Exception("** A^(k-1)_{k,k} == 0 in PALU decomp")
 
-        for i in range(k, n):
-           L[i][k] = B[i][k] / U[k][k]
+        # we set column k of L, multiplying by 1/U[k, k] rather than dividing every entry
+        L[k, k] = 1.0
+        L[k+1:, k] = B[k+1:, k] * (1.0 / U[k, k])
 
-        for i in range(k, n):
-            for j in range(k, n):
-                B[i][j] -= L[i][k] * U[k][j];
+        # we modify B for the next iteration with a single outer product,
+        # skipping row and column k which are not used again
+        B[k+1:, k+1:] -= np.outer(L[k+1:, k], U[k, k+1:])
 
     # we return P, L and U
-    return P, L, U
+    return P.tolist(), L.tolist(), U.tolist()
@@ -1,55 +1,75 @@
 
+import numpy as np
+from scipy.linalg import solve_triangular
 from findLargestInCol import *
-from swapRowsV2 import *
 
-# we write another function that composes A into A = P^{-1}LU where P is stored as a vector and swapRows is more efficient
+# we choose the width below which we stop recursing and eliminate column by column
+BLOCK = 64
+
+# we write a function that factorizes columns k0 to k1-1 of B in place, using rows k0 to n-1.
+# Row swaps are applied to whole rows of B and recorded in P, and on return the factorized
+# columns hold L (below the diagonal, with unit diagonal not stored) and U (on and above it)
+def _panelLU(B, P, k0, k1):
+
+    # if the panel is narrow we use the normal LU decomposition algorithm
+    if k1 - k0 <= BLOCK:
+        for k in range(k0, k1):
+
+            # we find the pivot
+            maxk = findLargestInCol(B, k)
+            if maxk != k:
+                B[[k, maxk]] = B[[maxk, k]]
+
+                # we swap two elements of P instead of two rows
+                P[k], P[maxk] = P[maxk], P[k]
+
+            # we check that we don't divide by zero
+            if B[k, k] == 0:
+                raise Exception("** A^(k-1)_{k,k} == 0 in PALU decomp")
+
+            # we compute column k of L and update the rest of the panel
+            B[k+1:, k] *= 1.0 / B[k, k]
+            B[k+1:, k+1:k1] -= np.outer(B[k+1:, k], B[k, k+1:k1])
+        return
+
+    # otherwise we split the panel into a left and a right half
+    km = (k0 + k1) // 2
+
+    # we factorize the left half
+    _panelLU(B, P, k0, km)
+
+    # we compute the top block of U in the right half by solving with L from the left half
+    B[k0:km, km:k1] = solve_triangular(B[k0:km, k0:km], B[k0:km, km:k1], lower=True, unit_diagonal=True)
+
+    # we update the remaining rows of the right half with a single matrix product
+    B[km:, km:k1] -= B[km:, k0:km] @ B[k0:km, km:k1]
+
+    # we factorize the right half
+    _panelLU(B, P, km, k1)
+
+# we write another function that composes A into A = P^{-1}LU where P is stored as a vector.
+# It splits the matrix recursively so that most of the work is done by blocked matrix products
 def PALUdecompV2(A):
 
+    # we make a copy of A to work with, stored as one contiguous array
+    B = np.array(A, dtype=np.float64)
+
     # we get the size of A
-    n = len(A)
+    n = len(B)
 
     # we check that A is indeed a square matrix
-    if n != len(A[0]):
+    if B.ndim != 2 or n != B.shape[1]:
         raise Exception("Input must be a square matrix")
 
-    # we initialize L and U to zero, P to {0,1, ..., n-1}
-    L = [[0] * n for i in range(n)]
-    U = [[0] * n for i in range(n)]
-    P = range(n)
-
-    # we make a copy of A to work with
-    B = [[0] * n for i in range(n)]
-    for i in range(n):
-        for j in range(n):
-            B[i][j] = A[i][j]
-
-    for k in range(n):
-
-        # we find the pivot
-        maxk = findLargestInCol(B, k)
-        if maxk != k:
-            swapRowsV2(B, maxk, k)
-            swapRowsV2(L, maxk, k)
-
-            # we swap two elements of P instead of two rows
-            temp = P[maxk]
-            P[maxk] = P[k]
-            P[k] = temp
-        
-        # we proceed with the normal LU decomposition algorithm
-        for j in range(k, n):
-            U[k][j] = B[k][j]
-
-        # we check that we don't divide by zero
-        if U[k][k] == 0:
-            raise Exception("** A^(k-1)_{k,k} == 0 in PALU decomp")
-
-        for i in range(k, n):
-           L[i][k] = B[i][k] / U[k][k]
-
-        for i in range(k, n):
-            for j in range(k, n):
-                B[i][j] -= L[i][k] * U[k][j];
+    # we initialize P to {0,1, ..., n-1}
+    P = list(range(n))
+
+    # we factorize all columns of B in place
+    _panelLU(B, P, 0, n)
+
+    # we read off L and U from B
+    L = np.tril(B, -1) + np.eye(n)
+    U = np.triu(B)
 
     # we return P, L and U
-    return P, L, U
+    return P, L.tolist(), U.tolist()
@@ -1,17 +1,18 @@
 
-# we write a function that returns the row index of the (absolutely) largest element in column k of the matrix A
+import numpy as np
+
+# we write a function that returns the row index of the (absolutely) largest element in column k of the matrix A,
+# only looking at rows k onwards since the rows above have already been used as pivots
 def findLargestInCol(A, k):
 
-	# we initialize the index and the current maximum
-	index = 0
-	curMax = abs(A[0][k])
+	# we get column k from row k downwards as an array of floats
+	if isinstance(A, np.ndarray):
+		col = A[k:, k]
+	else:
+		col = np.fromiter((row[k] for row in A[k:]), dtype=np.float64, count=len(A) - k)
 
-	# we loop through the rows of A keeping track of the largest value at position k we have seen so far
-	for i, row in enumerate(A):
-		val = abs(row[k])
-		if val > curMax:
-			curMax = val
-			index = i
+	# we get the index of the largest absolute value, counting from row k
+	index = k + int(np.abs(col).argmax())
 
 	# we return the index
 	return index
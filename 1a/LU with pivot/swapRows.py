@@ -2,21 +2,12 @@
 # we write a function that swaps rows u and v of some matrix A
 def swapRows(A, u, v):
 
-	# we get the size of A
- 	n, m = len(A), len(A[0])
+	# we make a new list of the rows of A, leaving A itself unchanged.
+	# Note that the rows themselves are not copied, so B shares them with A
+	B = A[:]
 
- 	# we initialize B to zero
- 	B = [[0] * m for i in range(n)]
-
- 	# we copy all entries from A to B but swap rows u and v
- 	for i in range(n):
- 		k = i
-		if k == u:
-			k = v
-		elif k == v:
-			k = u
-		for j in range(m):
-			B[i][j] = A[k][j]
+	# we swap rows u and v of B
+	B[u], B[v] = A[v], A[u]
 
 	# we return B
 	return B
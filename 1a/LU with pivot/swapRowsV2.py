@@ -2,7 +2,6 @@
 # we write a more efficient function that swaps rows u and v of some matrix A
 def swapRowsV2(A, u, v):
 
-	# we directly swap rows u and v of A without copying
-	for i, val in enumerate(A[u]):
-		A[u][i] = A[v][i]
-		A[v][i] = val
\ No newline at end of file
+	# we directly swap rows u and v of A without copying any entries,
+	# since the rows of A are separate lists we only need to swap them in A
+	A[u], A[v] = A[v], A[u]
@@ -0,0 +1,42 @@
+
+# we choose the size of the square blocks we work on, small enough
+# that the blocks of A, B and C we are using all stay in the cache
+BLOCK = 32
+
+# we write a version of mult that only uses plain python lists, for when numpy is not available.
+# It multiplies A and B block by block so that the entries we read are reused while they are still in the cache
+def multBlocked(A,B):
+
+	# we find the sizes of A and B
+	aRows, aCols = len(A), len(A[0])
+	bRows, bCols = len(B), len(B[0])
+
+	# we check if the matrix sizes are consistent with multiplication
+	if aCols != bRows:
+		raise Exception("matrix sizes don't agree")
+
+	# we store the transpose of B so that the columns of B are read along rows
+	BT = [list(col) for col in zip(*B)]
+
+	# we initialize C to a zero matrix of the appropriate size
+	C = [[0] * bCols for i in range(aRows)]
+
+	# we loop over all blocks of rows of A, columns of B and the shared index k
+	for ii in range(0, aRows, BLOCK):
+		for jj in range(0, bCols, BLOCK):
+			for kk in range(0, aCols, BLOCK):
+				kEnd = min(kk + BLOCK, aCols)
+
+				# and within each block we add the partial dot products to C
+				for i in range(ii, min(ii + BLOCK, aRows)):
+					Ai = A[i]
+					Ci = C[i]
+					for j in range(jj, min(jj + BLOCK, bCols)):
+						BTj = BT[j]
+						s = Ci[j]
+						for k in range(kk, kEnd):
+							s += Ai[k] * BTj[k]
+						Ci[j] = s
+
+	# we return C as the answer
+	return C
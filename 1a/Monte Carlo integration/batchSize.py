@@ -0,0 +1,7 @@
+
+# we choose how many random floats to generate at a time, so that memory use does not grow with n
+BATCH = 2**20
+
+# we write a function that returns how many Monte Carlo trials in d dimensions fit in one batch
+def batchSize(d):
+	return max(1, BATCH // max(d, 1))
@@ -1,18 +1,17 @@
 
-from random import random
-from math import exp, log
+import numpy as np
+from math import exp
 
-# we write a function that returns a random vector from [0,1]^d with exponential density
+# we write a function that returns a random vector from [0,1]^d with exponential density.
+# d can also be a shape such as (n, d), in which case we get n such vectors as the rows of an array
 def randExp(d, lam):
 
+	# we compute exp(-lambda) once
+	e = exp(-lam)
+
 	# we generate a uniformly random vector
-	x = [random() for i in range(d)]
+	u = np.random.random(d)
 
 	# we transform (elementwise) to random numbers in [exp(-lambda),1]
-	for i in range(d):
-		x[i] = exp(-lam) + (1-exp(-lam))*x[i]
-	
-	# we now get numbers with exponential density
-	for i in range(d):
-		x[i] = -log(x[i]) / lam
-	return x
+	# and from those get numbers with exponential density, all in one step
+	return -np.log(e + (1.0 - e) * u) / lam
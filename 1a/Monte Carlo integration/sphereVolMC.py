@@ -1,29 +1,28 @@
 
-from random import random
+import numpy as np
+from batchSize import *
 
 # we write a function that uses Monte Carlo to estimate the volume of the unit hypersphere in d dimensions using n trials
 def sphereVolMC(d, n):
 
 	# we initialize the counter variable
-	count = 0.0
+	count = 0
 
-	# we perform the Monte Carlo trial n times
-	for i in range(n):
+	# we perform the Monte Carlo trials in batches of m trials at a time
+	m = batchSize(d)
+	for start in range(0, n, m):
 
-		# we generate a vector with d random floats from [0,1]
-		x = [random() for k in range(d)]
+		# we generate the trials of this batch, each row being a vector with d random floats from [0,1]
+		x = np.random.random((min(m, n - start), d))
 
-		# we calculat the squared norm of x
-		norm2 = 0
-		for k in x:
-			norm2 += k*k
+		# we calculate the squared norm of every row of x in a single pass
+		norm2 = np.einsum('ij,ij->i', x, x)
 
-		# if x is inside the hypersphere we increment the count
-		if norm2 < 1:
-			count += 1
+		# we count the vectors that are inside the hypersphere
+		count += np.count_nonzero(norm2 < 1.0)
 
 	# we calculate the estimated volume given by
-	vol = 2**d * count / n
+	vol = 2.0**d * count / n
 	
 	# we return the estimated volume
 	return vol
@@ -1,31 +1,34 @@
 
+import numpy as np
+from math import exp, log
 from randExp import *
+from batchSize import *
 
 # we write an improoved function that uses Monte Carlo with exponential importance sampling
 # to estimate the volume of the unit hypersphere in d dimensions.
 # We choose our points x with independent Cartesian components and prob density exp(-lam.xi) / [ lam*((1-exp(-lam)) ].
 # We achieve this by taking xi = (1/lam) log (1/y) where y is chosen uniformly in (exp(-lam),1)
 def sphereVolMCImpExp(d, n, lam):
-	count = 0.0;
-	for i in range(n):
+	count = 0.0
 
-		# we generate x according to our distribution
-		x = randExp(d, lam)
+	# we compute the log of the constant factor of the density once
+	logc = log(lam / (1 - exp(-lam)))
 
-		# we calculate the squared norm of x and check if x is inside the hypersphere
-		norm2 = 0
-		for k in x:
-			norm2 += k*k
+	# we perform the trials in batches of m trials at a time
+	m = batchSize(d)
+	for start in range(0, n, m):
 
-		if norm2 < 1:
+		# we generate x according to our distribution, one row per trial
+		x = randExp((min(m, n - start), d), lam)
 
-			# we compute the density at x
-			rho = 1
-			for k in x:
+		# we calculate the squared norm of every row and keep those inside the hypersphere
+		norm2 = np.einsum('ij,ij->i', x, x)
+		x = x[norm2 < 1]
 
-				# note that y(i) = exp(-lam * x(i))
-				rho *= exp(-lam*k) * lam / (1-exp(-lam))
-			count += 1/rho
+		# we compute the log of the density at each x, working with logs so the product
+		# of d factors does not underflow, and add up 1/rho
+		logRho = -lam * x.sum(axis=1) + d * logc
+		count += np.exp(-logRho).sum()
 
 	vol =  2**d * count / n
-	return vol
\ No newline at end of file
+	return vol
@@ -1,4 +1,6 @@
 
+from math import copysign
+
 # we write an improved version of binarySearch that evaluates func fewer times
 # and checks if there is definitely a root in the initial interval
 def binarySearchV2(func, low, high, tol):
@@ -10,21 +12,26 @@ def binarySearchV2(func, low, high, tol):
   # we check if the initial interval definitely contains a root
   if f_low * f_high > 0:
       raise Exception("func(low) and func(high) must have different sign")
+
+  # if func is exactly zero at either end we have already found a root
+  if f_high == 0:
+      return high
+  if f_low == 0:
+      return low
+
+  # we only need the sign of func at high, which never changes since
+  # we only move high to points where func has that same sign
+  sign_high = copysign(1.0, f_high)
   
-  # the while loop is similar to before
-  while abs(high - low)/2 > tol * abs(low + high)/2:
+  # the while loop is similar to before, with the factors of 1/2 cancelled
+  while abs(high - low) > tol * abs(low + high):
     mid = (low + high)/2
 
-    # we only have one evaluation of func per loop
-    f_mid = func(mid)
-    
-    if f_high * f_mid > 0:
+    # we only have one evaluation of func per loop, and compare signs
+    # instead of multiplying, which could underflow to zero
+    if copysign(1.0, func(mid)) == sign_high:
         high = mid
-        f_high = f_mid
-        # in this case f_low stays the same
     else:
         low = mid
-        f_low = f_mid
-        # in this case f_high stays the same
  
   return (low + high)/2